@@ -1,13 +1,18 @@
 import asyncio
+from collections import OrderedDict, deque
+import httpx
 from playwright.async_api import async_playwright
+from selectolax.lexbor import LexborHTMLParser
 import json
 import re
-from urllib.parse import urlparse, urljoin, urldefrag
+from yarl import URL
 from datetime import datetime, timezone
 import sys
+import time
 
 # NEW: Import FastAPI and Pydantic
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 # --- CONFIGURATION (Your existing configuration here) ---
@@ -24,31 +29,69 @@ IGNORE_EXTENSIONS_PROTOCOLS = [
     ".pdf", ".zip", ".jpg", ".png", ".svg", ".css", ".js", ".xml", ".rss",
     "mailto:", "tel:", "javascript:"
 ]
+# Keyword lists compiled into single alternations so each path is scanned once
+IGNORE_PATH_REGEX = re.compile("|".join(map(re.escape, IGNORE_PATH_KEYWORDS)))
+PRIORITY_PATH_REGEX = re.compile("|".join(map(re.escape, PRIORITY_PATH_KEYWORDS)))
 IGNORE_LANG_CODES_REGEX = re.compile(r'^/([a-z]{2}(-[a-zA-Z]{2})?)/')
 IGNORE_PATTERN_REGEX = re.compile(r'/(catalogue|item|product|page-)/|\d{4,}')
 MAX_DEPTH = 2
+LINK_PRIORITY_LEVELS = 4  # 0 = low ... 3 = nav links / start URL
 MAX_PAGES = 25
 CONCURRENCY = 5
+# Politeness: cap on parallel requests to one host and the minimum gap
+# between starting two of them. A single-domain crawl keeps full concurrency.
+PER_HOST_CONCURRENCY = CONCURRENCY
+PER_HOST_DELAY = 0.1  # seconds
 PAGE_TIMEOUT = 15000  # ms
+PAGE_RECYCLE_EVERY = 10  # navigations before a worker swaps in a fresh page
 TOTAL_TIMEOUT = 45   # seconds - Aggressive timeout
 MAX_TEXT_CHARS = 8000
+# Pages with less text than this over plain HTTP are treated as JS-rendered
+STATIC_MIN_TEXT_CHARS = 200
+CACHE_TTL = 300  # seconds a finished crawl is served from memory
+CACHE_MAX_ENTRIES = 128
+USER_AGENT = "ColetteBot/1.4 (+https://example.com/bot-info)"
+# Shared by the Chromium and selectolax extractors so both keep the same text
+NOISE_TAGS = ["header", "footer", "nav", "aside", "script", "style"]
+MAIN_CONTENT_SELECTOR = "main, article, .main-content, .content, #main, #content"
+# Subresources we never need for text extraction; aborted before they hit the network.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet", "other"}
 
 # --- SCRIPT LOGIC (Your existing functions: clean_text, get_link_priority, etc.) ---
 # ... (paste all your functions from clean_text to crawl_final here) ...
 
 def clean_text(text: str) -> str:
     """Removes excess whitespace from text."""
-    return re.sub(r'\s+', ' ', text).strip()
+    # split() with no argument splits on whitespace runs and drops the ends
+    return " ".join(text.split())
 
 def get_link_priority(path: str) -> int:
     """Scores a link's relevance based on keywords."""
     path_lower = path.lower()
-    if any(keyword in path_lower for keyword in PRIORITY_PATH_KEYWORDS):
+    if PRIORITY_PATH_REGEX.search(path_lower):
         return 2  # High priority
     if path_lower == "/":
         return 1 # Medium priority for homepage
     return 0  # Low priority
 
+def url_key(url: URL) -> int:
+    """Hashes a normalized URL for the visited set.
+
+    Fragments, utm_* tracking params and trailing slashes are dropped so
+    variants of one page share a key; storing the hash instead of the
+    string keeps the set at a few machine words per URL.
+    """
+    query = [(k, v) for k, v in url.query.items() if not k.startswith("utm_")]
+    path = url.raw_path.rstrip("/") or "/"
+    return hash(str(url.with_path(path, encoded=True).with_query(query)))
+
+def url_host(url: URL) -> str:
+    """Returns host[:port] the way the browser's URL.host does: no userinfo,
+    and no port when it is the scheme's default."""
+    if url.explicit_port is None or url.is_default_port():
+        return url.raw_host
+    return f"{url.raw_host}:{url.port}"
+
 def is_relevant_link(href: str, base_netloc: str) -> bool:
     """Checks if a link is internal and relevant."""
     if not href or href.startswith("#"):
@@ -57,12 +100,12 @@ def is_relevant_link(href: str, base_netloc: str) -> bool:
     if any(href.lower().startswith(prefix) for prefix in IGNORE_EXTENSIONS_PROTOCOLS):
         return False
 
-    parsed_href = urlparse(href)
-    if parsed_href.netloc and parsed_href.netloc != base_netloc:
+    parsed_href = URL(href)
+    if parsed_href.raw_host and url_host(parsed_href) != base_netloc:
         return False
 
-    path = parsed_href.path.lower()
-    if any(keyword in path for keyword in IGNORE_PATH_KEYWORDS):
+    path = parsed_href.raw_path.lower()
+    if IGNORE_PATH_REGEX.search(path):
         return False
         
     if IGNORE_PATTERN_REGEX.search(path):
@@ -70,106 +113,336 @@ def is_relevant_link(href: str, base_netloc: str) -> bool:
         
     return True
 
+async def block_heavy_resources(route):
+    """Aborts requests for resources that don't contribute to the page text."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 async def extract_main_content(page):
     """Removes common noise elements and extracts text from the main content area."""
-    await page.evaluate("document.querySelectorAll('header, footer, nav, aside, script, style').forEach(el => el.remove())")
-    
-    main_content = await page.query_selector("main, article, .main-content, .content, #main, #content")
-    if main_content:
-        return await main_content.inner_text()
-    return await page.locator("body").inner_text()
+    # One round-trip: strip the noise and read the text in the same evaluate.
+    return await page.evaluate("""([noiseSelector, mainSelector]) => {
+        document.querySelectorAll(noiseSelector).forEach(el => el.remove());
+        const main = document.querySelector(mainSelector);
+        return (main || document.body).innerText;
+    }""", [", ".join(NOISE_TAGS), MAIN_CONTENT_SELECTOR])
+
+# In-page counterpart of is_relevant_link/get_link_priority: resolves, filters,
+# dedups and scores every <a href> in V8 so only crawlable links cross CDP.
+EXTRACT_LINKS_JS = """({baseNetloc, ignorePrefixes, ignorePathPattern, ignorePattern, priorityPathPattern}) => {
+    const ignorePathRe = new RegExp(ignorePathPattern);
+    const ignoreRe = new RegExp(ignorePattern);
+    const priorityPathRe = new RegExp(priorityPathPattern);
+    const links = new Map();
+    for (const a of document.querySelectorAll('a[href]')) {
+        const href = a.getAttribute('href');
+        if (!href || href.startsWith('#')) continue;
+        const hrefLower = href.toLowerCase();
+        if (ignorePrefixes.some(prefix => hrefLower.startsWith(prefix))) continue;
+
+        let url;
+        // baseURI is the page's real location after redirects, or its <base href>
+        try { url = new URL(href, document.baseURI); } catch (e) { continue; }
+        if (url.host !== baseNetloc) continue;
+
+        const path = url.pathname.toLowerCase();
+        if (ignorePathRe.test(path)) continue;
+        if (ignoreRe.test(path)) continue;
+
+        url.hash = '';
+        let priority = 0;
+        if (a.closest('nav')) priority = 3;
+        else if (priorityPathRe.test(path)) priority = 2;
+        else if (path === '/') priority = 1;
+
+        const known = links.get(url.href);
+        if (!known || known.priority < priority) links.set(url.href, { href, url: url.href, priority });
+    }
+    return [...links.values()];
+}"""
+
+async def extract_links(page, base_netloc: str):
+    """Returns [{href, url, priority}] for the relevant internal links on the page."""
+    return await page.evaluate(EXTRACT_LINKS_JS, {
+        "baseNetloc": base_netloc,
+        "ignorePrefixes": IGNORE_EXTENSIONS_PROTOCOLS,
+        "ignorePathPattern": IGNORE_PATH_REGEX.pattern,
+        "ignorePattern": IGNORE_PATTERN_REGEX.pattern,
+        "priorityPathPattern": PRIORITY_PATH_REGEX.pattern,
+    })
+
+class LinkFrontier:
+    """Per-host crawl queues with one FIFO deque per link priority.
+
+    Priorities are a small fixed set, so this avoids the heap and lock of
+    asyncio.PriorityQueue; a single Event wakes workers when links arrive
+    or a host frees up. Each host serves at most PER_HOST_CONCURRENCY
+    requests at once, started at least PER_HOST_DELAY apart, and workers
+    take from the ready host that has waited longest. The crawl is done
+    once every worker is idle on an empty frontier, or when close() is
+    called.
+    """
+
+    def __init__(self, workers: int):
+        self._hosts = {}      # host -> deques indexed by link priority
+        self._in_flight = {}  # host -> items handed out and not yet released
+        self._next_ok = {}    # host -> loop time of its next allowed request
+        self._new_item = asyncio.Event()
+        self._workers = workers
+        self._idle = 0
+        self.done = asyncio.Event()
+
+    def put(self, host: str, priority: int, item):
+        if host not in self._hosts:
+            self._hosts[host] = [deque() for _ in range(LINK_PRIORITY_LEVELS)]
+            self._in_flight[host] = 0
+            self._next_ok[host] = 0.0
+        self._hosts[host][priority].append(item)
+        self._new_item.set()
+
+    def _pick_host(self, now: float):
+        """Returns (host, None) for a host ready to serve, else (None, seconds
+        until the next one is ready), or (None, None) when nothing is queued."""
+        ready, wait, queued = None, None, False
+        for host, buckets in self._hosts.items():
+            if not any(buckets):
+                continue
+            queued = True
+            if self._in_flight[host] >= PER_HOST_CONCURRENCY:
+                continue
+            delay = self._next_ok[host] - now
+            if delay > 0:
+                wait = delay if wait is None else min(wait, delay)
+            elif ready is None or self._next_ok[host] < self._next_ok[ready]:
+                ready = host
+        if ready is None and queued and wait is None:
+            wait = PER_HOST_DELAY  # every queued host is busy; a release wakes us
+        return ready, wait
+
+    async def get(self):
+        """Returns (host, item) for the next item, or None once the crawl is done."""
+        loop = asyncio.get_running_loop()
+        while not self.done.is_set():
+            now = loop.time()
+            host, wait = self._pick_host(now)
+            if host is not None:
+                bucket = next(b for b in reversed(self._hosts[host]) if b)
+                self._in_flight[host] += 1
+                self._next_ok[host] = now + PER_HOST_DELAY
+                return host, bucket.popleft()
+
+            self._new_item.clear()
+            if wait is not None:
+                try:
+                    await asyncio.wait_for(self._new_item.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
 
-async def crawl_final(domain: str):
+            self._idle += 1
+            if self._idle == self._workers:
+                self.close()
+            else:
+                await self._new_item.wait()
+            self._idle -= 1
+        return None
+
+    def release(self, host: str):
+        """Marks an item from host as finished so the host can serve again."""
+        self._in_flight[host] -= 1
+        self._new_item.set()
+
+    def close(self):
+        self.done.set()
+        self._new_item.set()  # release idle workers so they see done
+
+def extract_static_content(tree) -> str:
+    """Same as extract_main_content, on a selectolax tree instead of a live page."""
+    tree.strip_tags(NOISE_TAGS)  # decomposes every match inside Lexbor
+    main_content = tree.css_first(MAIN_CONTENT_SELECTOR) or tree.body
+    return main_content.text(separator=" ") if main_content else ""
+
+def extract_static_links(tree, page_url: str, base_netloc: str, seen_hrefs=frozenset()):
+    """Python counterpart of EXTRACT_LINKS_JS for pages fetched over plain HTTP.
+
+    Hrefs in seen_hrefs were handled on an earlier page and are skipped
+    before any resolving or filtering.
+    """
+    base = URL(page_url)
+    base_tag = tree.css_first("base[href]")
+    if base_tag is not None:
+        try:
+            base = base.join(URL(base_tag.attributes["href"]))
+        except ValueError:
+            pass
+    nav_hrefs = {a.attributes.get("href") for a in tree.css("nav a[href]")}
+    links = {}
+    for a in tree.css("a[href]"):
+        href = a.attributes.get("href")
+        if not href or href.startswith("#") or href in seen_hrefs:
+            continue
+        try:
+            url = base.join(URL(href)).with_fragment(None)
+            # Host and path rules see the resolved URL, as in EXTRACT_LINKS_JS
+            if not is_relevant_link(str(url), base_netloc):
+                continue
+        except ValueError:
+            continue
+
+        priority = 3 if href in nav_hrefs else get_link_priority(url.raw_path)
+        abs_url = str(url)
+        known = links.get(abs_url)
+        if known is None or known["priority"] < priority:
+            links[abs_url] = {"href": href, "url": abs_url, "priority": priority}
+    return list(links.values())
+
+async def fetch_static(http, url: str, base_netloc: str, with_links: bool, seen_hrefs=frozenset()):
+    """Fetches a page without a browser.
+
+    Returns (text, links), or None when the page has to be rendered in
+    Chromium: non-HTML, non-200, or too little text to be server-rendered.
+    """
+    try:
+        response = await http.get(url)
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200 or "html" not in response.headers.get("content-type", ""):
+        return None
+
+    tree = LexborHTMLParser(response.text)
+    # Resolve against where redirects ended up, as the browser would
+    links = extract_static_links(tree, str(response.url), base_netloc, seen_hrefs) if with_links else []
+    text = extract_static_content(tree)
+    if len(text) < STATIC_MIN_TEXT_CHARS:
+        return None
+    return text, links
+
+async def fetch_rendered(page, url: str, base_netloc: str, with_links: bool):
+    """Loads a page in Chromium and returns (text, links)."""
+    await page.goto(url, timeout=PAGE_TIMEOUT, wait_until="commit")
+    # Links first: extract_main_content strips the nav we boost links from
+    links = await extract_links(page, base_netloc) if with_links else []
+    text = await extract_main_content(page)
+    return text, links
+
+async def crawl_final(browser, http, domain: str):
     # This function remains exactly the same as yours, but it will return data
     # instead of printing to the console or writing to a file.
+    # The browser and HTTP client are shared across crawls; each crawl gets
+    # its own browser context. Pages are fetched over plain HTTP first and
+    # only rendered in Chromium when that yields too little text.
     if not domain.startswith(("http://", "https://")):
         domain = "https://" + domain
 
-    parsed_domain = urlparse(domain)
-    base_url = f"{parsed_domain.scheme}://{parsed_domain.netloc}"
-    base_netloc = parsed_domain.netloc
-    
-    initial_path = parsed_domain.path
+    parsed_domain = URL(domain)
+    base_url = str(parsed_domain.origin())
+    base_netloc = url_host(parsed_domain)  # compared against JS URL.host
     
     results = {}
-    visited_urls = set()
-    priority_queue = asyncio.PriorityQueue()
+    visited = set()  # url_key() hashes of every URL ever enqueued
+    # Raw hrefs already handled; repeated header/footer links stop here
+    seen_hrefs = set()
+    frontier = LinkFrontier(CONCURRENCY)
+    # One slot per result; reserved before navigating so workers never
+    # start more pages than MAX_PAGES can still accept.
+    page_slots = asyncio.Semaphore(MAX_PAGES)
 
-    start_url = urljoin(base_url, initial_path)
-    await priority_queue.put((-3, start_url, 1)) # Highest priority
-    visited_urls.add(start_url)
+    # Queue items carry the URL's path so workers never re-parse it
+    start = parsed_domain.with_query(None).with_fragment(None)
+    frontier.put(base_netloc, 3, (str(start), start.raw_path or "/", 1)) # Highest priority
+    visited.add(url_key(start))
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(user_agent="ColetteBot/1.4 (+https://example.com/bot-info)")
-        
+    context = await browser.new_context(user_agent=USER_AGENT)
+    try:
+        await context.route("**/*", block_heavy_resources)
+
         async def worker(worker_id):
-            page = await context.new_page()
-            while True:
+            page = None  # opened on the first page that needs rendering
+            nav_count = 0
+            while (entry := await frontier.get()) is not None:
+                host, (full_url, path_key, depth) = entry
+                await page_slots.acquire()
+                if frontier.done.is_set():
+                    page_slots.release()
+                    break
+                slot_used = False
                 try:
-                    priority, full_url, depth = await asyncio.wait_for(priority_queue.get(), timeout=3.0)
-
-                    if len(results) >= MAX_PAGES:
-                        priority_queue.task_done()
-                        continue
-                    
-                    await page.goto(full_url, timeout=PAGE_TIMEOUT, wait_until="commit")
+                    with_links = depth < MAX_DEPTH
+                    fetched = await fetch_static(http, full_url, base_netloc, with_links, seen_hrefs)
+                    if fetched is None:
+                        # A fresh page bounds the JS heap a long-lived tab accumulates
+                        if page is None or nav_count == PAGE_RECYCLE_EVERY:
+                            if page is not None:
+                                await page.close()
+                            page = await context.new_page()
+                            nav_count = 0
+                        nav_count += 1
+                        fetched = await fetch_rendered(page, full_url, base_netloc, with_links)
+                    text, links = fetched
                     
-                    text = await extract_main_content(page)
-                    path_key = urlparse(full_url).path or "/"
-                    
-                    if "page not found" in text.lower() and len(text) < 150:
-                         priority_queue.task_done()
+                    # Length gate first: only short bodies are worth lowercasing
+                    if len(text) < 150 and "page not found" in text.lower():
                          continue
 
-                    results[path_key] = clean_text(text)[:MAX_TEXT_CHARS]
+                    slot_used = path_key not in results  # re-crawled paths overwrite
+                    # 2x the limit is a heuristic margin for whitespace cleaning removes;
+                    # whitespace-heavy pages can still end up shorter than the limit
+                    results[path_key] = clean_text(text[:MAX_TEXT_CHARS * 2])[:MAX_TEXT_CHARS]
                     # Removed the print statement for cleaner API logs
+                    if len(results) >= MAX_PAGES:
+                        frontier.close()
+                        break
 
-                    if depth < MAX_DEPTH:
-                        links = await page.eval_on_selector_all("a[href]", "elements => elements.map(e => ({ href: e.getAttribute('href'), inNav: !!e.closest('nav') }))")
-                        
-                        unique_hrefs = {link['href'] for link in links if link['href']}
-
-                        for href in unique_hrefs:
-                            if is_relevant_link(href, base_netloc):
-                                abs_url = urldefrag(urljoin(full_url, href)).url
-                                if abs_url not in visited_urls:
-                                    if len(visited_urls) < MAX_PAGES * 5:
-                                        visited_urls.add(abs_url)
-                                        link_priority = get_link_priority(urlparse(abs_url).path)
-                                        # Check if the original link was in a nav
-                                        if any(link.get('href') == href and link.get('inNav') for link in links):
-                                            link_priority = 3 # Boost priority for nav links
-                                        await priority_queue.put((-link_priority, abs_url, depth + 1))
-                except asyncio.TimeoutError:
-                    break
+                    # Links arrive resolved, filtered and scored (nav links = 3)
+                    for link in links:
+                        href = link["href"]
+                        if href in seen_hrefs:
+                            continue
+                        # Page-relative hrefs resolve differently per page, only
+                        # absolute and root-relative ones are safe to key on.
+                        if href.startswith(("/", "http:", "https:")):
+                            seen_hrefs.add(href)
+
+                        abs_url = link["url"]
+                        parsed = URL(abs_url)
+                        key = url_key(parsed)
+                        if key not in visited:
+                            if len(visited) < MAX_PAGES * 5:
+                                visited.add(key)
+                                item = (abs_url, parsed.raw_path or "/", depth + 1)
+                                frontier.put(url_host(parsed), link["priority"], item)
                 except Exception as e:
                     if 'Target page, context or browser has been closed' not in str(e):
                         # Suppress noise during shutdown
                         pass
                 finally:
-                    if not priority_queue.empty():
-                        priority_queue.task_done()
-            await page.close()
+                    frontier.release(host)
+                    if not slot_used:
+                        page_slots.release()  # rejected page, hand the slot back
+            if page is not None:
+                await page.close()
 
         tasks = [asyncio.create_task(worker(i)) for i in range(CONCURRENCY)]
         
         try:
-            await asyncio.wait_for(priority_queue.join(), timeout=TOTAL_TIMEOUT)
+            await asyncio.wait_for(frontier.done.wait(), timeout=TOTAL_TIMEOUT)
         except asyncio.TimeoutError:
             # Using print(file=sys.stderr) is good for logging on servers
             print(f"🚨 Total crawl timeout of {TOTAL_TIMEOUT}s reached.", file=sys.stderr)
+            frontier.close()
 
         for task in tasks:
             task.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
         await context.close()
-        await browser.close()
 
     # MODIFIED: Instead of writing to a file, return the dictionary
     return {
         "domain": base_url,
-        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+        "timestamp_utc": datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat(),
         "sections": results
     }
 
@@ -180,18 +453,70 @@ app = FastAPI(
     version="1.0.0"
 )
 
+@app.on_event("startup")
+async def start_clients():
+    """Launches a single Chromium instance and HTTP pool shared by all crawls."""
+    app.state.playwright = await async_playwright().start()
+    app.state.browser = await app.state.playwright.chromium.launch(headless=True)
+    # Keep-alive pool amortizes TCP/TLS handshakes across pages of a host
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(max_keepalive_connections=CONCURRENCY * 2),
+        timeout=PAGE_TIMEOUT / 1000,
+    )
+
+@app.on_event("shutdown")
+async def stop_clients():
+    await app.state.http.aclose()
+    await app.state.browser.close()
+    await app.state.playwright.stop()
+
+# Recent crawl results, least recently used first: domain -> (monotonic time, data)
+crawl_cache = OrderedDict()
+
+# Crawls currently running: domain -> task; concurrent requests share it
+inflight_crawls = {}
+
+async def crawl_and_cache(domain: str):
+    """Runs a crawl and caches a non-empty result, even if every caller has left."""
+    data = await crawl_final(app.state.browser, app.state.http, domain)
+    if data["sections"]:
+        crawl_cache[domain] = (time.monotonic(), data)
+        crawl_cache.move_to_end(domain)
+        if len(crawl_cache) > CACHE_MAX_ENTRIES:
+            crawl_cache.popitem(last=False)
+    return data
+
+def forget_crawl(domain: str, task):
+    inflight_crawls.pop(domain, None)
+    if not task.cancelled():
+        task.exception()  # mark it retrieved; waiters, if any, report it
+
 # Pydantic model for input validation
 class CrawlRequest(BaseModel):
     domain: str
 
-@app.post("/crawl/", summary="Crawl a website")
+@app.post("/crawl/", summary="Crawl a website", response_class=ORJSONResponse)
 async def run_crawl(request: CrawlRequest):
     """
     Takes a domain, crawls it based on predefined rules, and returns the extracted text content.
     """
+    cached = crawl_cache.get(request.domain)
+    if cached and time.monotonic() - cached[0] < CACHE_TTL:
+        crawl_cache.move_to_end(request.domain)
+        return cached[1]
+
     try:
-        print(f"Starting crawl for {request.domain}...")
-        data = await crawl_final(request.domain)
+        crawl = inflight_crawls.get(request.domain)
+        if crawl is None:
+            print(f"Starting crawl for {request.domain}...")
+            crawl = asyncio.create_task(crawl_and_cache(request.domain))
+            inflight_crawls[request.domain] = crawl
+            crawl.add_done_callback(lambda task: forget_crawl(request.domain, task))
+        # Shielded so one caller disconnecting doesn't cancel it for the others
+        data = await asyncio.shield(crawl)
         if not data["sections"]:
             raise HTTPException(status_code=404, detail="Could not crawl the domain or found no content.")
         print(f"Crawl for {request.domain} successful, found {len(data['sections'])} pages.")